@@ -203,22 +203,34 @@ class Grid(Entity):
         :return: Grid points (latitudes and longitudes in degrees).
         :rtype: namedtuple, (list, list), float
 
+        """
+        (lat, lon) = self._get_lat_lon_arrays()
+
+        return GridPoint(latitude=list(lat), longitude=list(lon))
+
+    def _get_lat_lon_arrays(self):
+        """ Get the grid points (coordinates) as numpy arrays.
+
+        :return: Latitudes and longitudes (in degrees) of the grid points.
+        :rtype: tuple, (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+
         """
         [lat, lon] = self.point_group.GetLatLonVectors()
-        # convert to degrees and round to two decimal places
+        # convert to degrees and round to three decimal places
         lat= np.rad2deg(np.array(lat)).round(decimals=3)
         lon= np.rad2deg(np.array(lon)).round(decimals=3)   
 
-        return GridPoint(latitude=list(lat), longitude=list(lon))
+        return (lat, lon)
     
     def get_lat_lon_from_index(self, indexes):
         """ Get the grid points (coordinates) corresponding to the input (list of) point-indices.
         
-        :param indexes: List of indices.
-        :paramtype indexes: list, int
+        :param indexes: List (or numpy array) of indices.
+        :paramtype indexes: list, int or :class:`numpy.ndarray`
 
-        :return: Grid points (latitudes and longitudes in degrees) corresponding to the input indices.
-        :rtype: namedtuple, (list, list), float
+        :return: Grid points (latitudes and longitudes in degrees) corresponding to the input indices. If the indices are input as a numpy array,
+                 the latitudes and longitudes are returned as numpy arrays.
+        :rtype: namedtuple, (list, list), float or (:class:`numpy.ndarray`, :class:`numpy.ndarray`) if the indices are input as a numpy array
 
         """
         # if only one index specified
@@ -229,6 +241,10 @@ class Grid(Entity):
             if len(indexes)==1:
                 (lat, lon) = self.point_group.GetLatAndLon(indexes[0])
                 return GridPoint(latitude=np.rad2deg(lat).round(decimals=3), longitude=np.rad2deg(lon).round(decimals=3))
+        elif isinstance(indexes, np.ndarray):
+            # filter using the array of indices directly (without conversion to python lists)
+            (lat, lon) = self._get_lat_lon_arrays()
+            return GridPoint(latitude=lat[indexes], longitude=lon[indexes])
 
         (_lat, _lon) = self.get_lat_lon()
         # make indexes into a list if not list
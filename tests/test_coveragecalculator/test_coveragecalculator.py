@@ -12,194 +12,182 @@
 """
 
 import json
-import os, shutil
+import os
 import sys
+import functools
 import unittest
-import numpy as np
 import pandas as pd
-import random
-import warnings 
+from pandas.testing import assert_frame_equal
 
 from orbitpy.coveragecalculator import CoverageCalculatorFactory, GridCoverage, PointingOptionsCoverage, PointingOptionsWithGridCoverage
-import orbitpy.coveragecalculator
-from orbitpy.grid import Grid
-from orbitpy.util import Spacecraft, OrbitState, SpacecraftBus
-from orbitpy.propagator import PropagatorFactory
+from orbitpy.coveragecalculator import helper_extract_coverage_parameters_of_spacecraft, find_in_cov_params_list, filter_mid_interval_access
+from orbitpy.util import Spacecraft
 
-from instrupy.util import ViewGeometry, Orientation, SphericalGeometry
-from instrupy import Instrument
+from instrupy.util import ViewGeometry, Orientation
 
 sys.path.append('../')
 from util.spacecrafts import spc1_json, spc2_json, spc3_json
+from util.helpers import make_out_dir
+
+# parse the spacecraft specifications once
+_spc1_dict = json.loads(spc1_json)
+_spc2_dict = json.loads(spc2_json)
+_spc3_dict = json.loads(spc3_json)
 
 RE = 6378.137 # radius of Earth in kilometers
 
+_read_access_csv = functools.partial(pd.read_csv, skiprows = [0,1,2,3]) # reader of access files: 5th row header, 6th row onwards contains the data
+
+################## Expected view-geometries of the test spacecrafts (built once and shared by the tests) ##################
+def _orient(ref_frame, euler_angle2=0.0):
+    """ Orientation specifications (EULER convention, sequence 1,2,3) with the only non-zero angle being the second euler angle."""
+    return {'referenceFrame': ref_frame, 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': euler_angle2, 'eulerAngle3': 0.0, 
+            'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}
+
+def _circ(diameter):
+    """ Circular spherical-geometry specifications."""
+    return {'shape': 'CIRCULAR', 'diameter': diameter, '@id': None}
+
+def _rect(angle_height, angle_width):
+    """ Rectangular spherical-geometry specifications."""
+    return {'shape': 'RECTANGULAR', 'angleHeight': angle_height, 'angleWidth': angle_width, '@id': None}
+
+# scene field-of-views
+_FOV_CIRC_5 = ViewGeometry.from_dict({"orientation": _orient('SC_BODY_FIXED'), "sphericalGeometry": _circ(5.0)})
+_FOV_RECT_5x10 = ViewGeometry.from_dict({"orientation": _orient('SC_BODY_FIXED'), "sphericalGeometry": _rect(5.0, 10)})
+_FOV_RECT_5x10_OFF_PLUS25 = ViewGeometry.from_dict({"orientation": _orient('SC_BODY_FIXED', 25.0), "sphericalGeometry": _rect(5.0, 10)})
+_FOV_RECT_5x10_OFF_MINUS25 = ViewGeometry.from_dict({"orientation": _orient('SC_BODY_FIXED', -25.0), "sphericalGeometry": _rect(5.0, 10)})
+# field-of-regards (note that the field-of-regard is a list of ViewGeometry objects)
+_FOR_NADIR_CIRC_15 = [ViewGeometry.from_dict({"orientation": _orient('NADIR_POINTING'), "sphericalGeometry": _circ(15.0)})]
+_FOR_NADIR_RECT_5x10_OFF_PLUS12_5 = [ViewGeometry.from_dict({"orientation": _orient('NADIR_POINTING', 12.5), "sphericalGeometry": _rect(5.0, 10)})]
+_FOR_NADIR_RECT_5x15_DOUBLE_ROLL = [ViewGeometry.from_dict({"orientation": _orient('NADIR_POINTING', 12.5), "sphericalGeometry": _rect(5, 15)}), 
+                                    ViewGeometry.from_dict({"orientation": _orient('NADIR_POINTING', 347.5), "sphericalGeometry": _rect(5, 15)})]
+# pointing-options
+_PNT_OPT_XYZ_PM2_5 = [Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":2.5, "zRotation":0}),
+                      Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":-2.5, "zRotation":0})]
+_PNT_OPT_SIDE_LOOK_10_15 = [Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "SIDE_LOOK", "sideLookAngle":10}),
+                            Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "SIDE_LOOK", "sideLookAngle":15})]
+
+# Expected coverage parameters of the test spacecrafts: (instru_id, mode_id, scene_field_of_view, field_of_regard, pointing_option).
+# An expected id of ``None`` indicates an id which is automatically (randomly) assigned, and hence is only checked to be present.
+# spc1 spacecraft, 1 instrument, 1 mode 
+_EXPECTED_SPC1 = [('bs1', '0', _FOV_CIRC_5, _FOR_NADIR_CIRC_15, _PNT_OPT_XYZ_PM2_5)]
+# spc2 spacecraft, no instruments 
+_EXPECTED_SPC2 = []
+# spc3 spacecraft, 3 instruments, 1st and 2nd instrument have 1 mode and 3rd instrument has 3 modes 
+_EXPECTED_SPC3 = [('bs1', '0', _FOV_CIRC_5, _FOR_NADIR_CIRC_15, None),                                   # instrument 1
+                  (None, 101, _FOV_CIRC_5, _FOR_NADIR_RECT_5x10_OFF_PLUS12_5, _PNT_OPT_SIDE_LOOK_10_15),  # instrument 2
+                  ('bs3', 0, _FOV_RECT_5x10, _FOR_NADIR_RECT_5x15_DOUBLE_ROLL, None),                      # instrument 3, mode 1
+                  ('bs3', 1, _FOV_RECT_5x10_OFF_PLUS25, _FOR_NADIR_RECT_5x15_DOUBLE_ROLL, None),           # instrument 3, mode 2
+                  ('bs3', None, _FOV_RECT_5x10_OFF_MINUS25, _FOR_NADIR_RECT_5x15_DOUBLE_ROLL, None)]       # instrument 3, mode 3
+
+# Queries of the coverage parameters lists: (instru_id, mode_id, index of the expected entry in the coverage parameters list)
+_FIND_QUERIES_SPC1 = [('bs1', '0', 0), (None, None, 0), ('bs1', None, 0), (None, '0', 0)]
+_FIND_QUERIES_SPC3 = [('bs3', 1, 3), ('bs3', None, 2), (None, None, 0)]
+
 class TestCoverageCalculatorFunctions(unittest.TestCase):   
                                 
     @classmethod
     def setUpClass(cls):
-        # Create new working directory to store output of all the class functions. 
+        # Create new (unique) working directory to store output of all the class functions.
         cls.dir_path = os.path.dirname(os.path.realpath(__file__))
-        cls.out_dir = os.path.join(cls.dir_path, 'temp')
-        if os.path.exists(cls.out_dir):
-            shutil.rmtree(cls.out_dir)
-        os.makedirs(cls.out_dir)
+        cls.out_dir = make_out_dir(cls, prefix='covcalc_')
+        # pre-run results used for comparison
+        cls.test_data_dir = os.path.realpath(os.path.join(cls.dir_path, '..', 'test_data'))
+        cls.inp_acc_fl = os.path.join(cls.test_data_dir, 'accessData.csv')
+        cls.truth_mid_interval_acc_fl = os.path.join(cls.test_data_dir, 'midIntervalAccessData.csv')
+
+        # build the test spacecrafts and extract their coverage parameters once, and share across the class functions
+        cls.spc1 = Spacecraft.from_dict(_spc1_dict)
+        cls.spc2 = Spacecraft.from_dict(_spc2_dict)
+        cls.spc3 = Spacecraft.from_dict(_spc3_dict)
+        cls.cov_params_spc1 = helper_extract_coverage_parameters_of_spacecraft(cls.spc1)
+        cls.cov_params_spc2 = helper_extract_coverage_parameters_of_spacecraft(cls.spc2)
+        cls.cov_params_spc3 = helper_extract_coverage_parameters_of_spacecraft(cls.spc3)
+
+        # read the pre-run (truth) mid-interval access data once
+        cls.truth_mid_interval_acc_df = _read_access_csv(cls.truth_mid_interval_acc_fl)
+        # in-memory access data and the corresponding (truth) mid-interval access data
+        cls.mid_interval_inp_acc_df = pd.DataFrame({ 'time index': [ 0,  1,  2,  3,  4,  4,  4,  5,  5,  6,  6,  7,  8], 
+                                                     'GP index'  : [10, 11, 11, 11, 12, 13, 14, 12, 13, 12, 10, 10, 11],
+                                                     'lat [deg]' : [10.0, 11.0, 11.0, 11.0, 12.0, 13.0, 14.0, 12.0, 13.0, 12.0, 10.0, 10.0, 11.0],
+                                                     'lon [deg]':  [10.0, 11.0, 11.0, 11.0, 12.0, 13.0, 14.0, 12.0, 13.0, 12.0, 10.0, 10.0, 11.0]})
+        cls.mid_interval_truth_df = pd.DataFrame({ 'time index': [  0,  2,  4,  4,  5,   7,  8 ], 
+                                                   'GP index'  : [ 10, 11, 13,  14, 12, 10, 11 ],
+                                                   'lat [deg]' : [10.0, 11.0, 13.0,  14.0, 12.0, 10.0, 11.0],
+                                                   'lon [deg]' : [10.0, 11.0, 13.0,  14.0, 12.0, 10.0, 11.0]})
+
+    def _assert_cov_params(self, cov_params, expected):
+        """ Check the extracted coverage parameters against the expected (instru_id, mode_id, scene_field_of_view, field_of_regard, pointing_option) tuples."""
+        self.assertEqual(len(cov_params), len(expected))
+        for idx, (x, (instru_id, mode_id, scene_field_of_view, field_of_regard, pointing_option)) in enumerate(zip(cov_params, expected)):
+            with self.subTest(idx=idx):
+                if instru_id is None:
+                    self.assertIsNotNone(x.instru_id)
+                else:
+                    self.assertEqual(x.instru_id, instru_id)
+                if mode_id is None:
+                    self.assertIsNotNone(x.mode_id)
+                else:
+                    self.assertEqual(x.mode_id, mode_id)
+                self.assertEqual(x.scene_field_of_view, scene_field_of_view)
+                self.assertEqual(x.field_of_regard, field_of_regard)
+                if pointing_option is None:
+                    self.assertIsNone(x.pointing_option)
+                else:
+                    self.assertEqual(x.pointing_option, pointing_option)
 
     def test_helper_extract_coverage_parameters_of_spacecraft(self):
-        
-        # spc1 spacecraft, 1 instrument, 1 mode 
-        spc1 = Spacecraft.from_json(spc1_json)
-        x = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc1)
-        self.assertEqual(len(x), 1)
-        self.assertEqual(x[0].instru_id, 'bs1')
-        self.assertEqual(x[0].mode_id, '0')
-        self.assertEqual(x[0].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'CIRCULAR', 'diameter': 5.0, '@id': None}}))
-        self.assertEqual(x[0].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                            [ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'CIRCULAR', 'diameter': 15.0, '@id': None}})])
-        self.assertEqual(x[0].pointing_option, [Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":2.5, "zRotation":0}),
-                                                Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":-2.5, "zRotation":0})])
-
-        # spc2 spacecraft, no instruments 
-        spc2 = Spacecraft.from_json(spc2_json)
-        x = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc2)
-        self.assertEqual(x,[])
-
-        # spc3 spacecraft, 3 instruments, 1st and 2nd instrument have 1 mode and 3rd instrument has 3 modes 
-        spc3 = Spacecraft.from_json(spc3_json)
-        x = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc3)
-        self.assertEqual(len(x), 5)
-        # instrument 1        
-        self.assertEqual(x[0].instru_id, 'bs1')
-        self.assertEqual(x[0].mode_id, '0')
-        self.assertEqual(x[0].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'CIRCULAR', 'diameter': 5.0, '@id': None}}))
-        self.assertEqual(x[0].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                            [ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'CIRCULAR', 'diameter': 15.0, '@id': None}})])
-        self.assertIsNone(x[0].pointing_option)
-        # instrument 2             
-        self.assertIsNotNone(x[1].instru_id)
-        self.assertEqual(x[1].mode_id, 101)
-        self.assertEqual(x[1].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'CIRCULAR', 'diameter': 5.0, '@id': None}}))
-        self.assertEqual(x[1].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                            [ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 12.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                          "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5.0, 'angleWidth': 10, '@id': None}})])
-        self.assertEqual(x[1].pointing_option, [Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "SIDE_LOOK", "sideLookAngle":10}),
-                                                Orientation.from_dict({"referenceFrame": "NADIR_POINTING", "convention": "SIDE_LOOK", "sideLookAngle":15})])
-        # instrument 3, mode 1         
-        self.assertEqual(x[2].instru_id, 'bs3')
-        self.assertEqual(x[2].mode_id, 0)
-        
-        self.assertEqual(x[2].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 0.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5.0, 'angleWidth': 10, '@id': None}}))
-        self.assertEqual(x[2].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                                [
-                                    ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 12.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                                 "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}}), 
-                                    ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 347.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                                 "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}})
-                                ]
-                        )
-        self.assertIsNone(x[2].pointing_option)
-        # instrument 3, mode 2
-        self.assertEqual(x[3].instru_id, 'bs3')
-        self.assertEqual(x[3].mode_id, 1)        
-        self.assertEqual(x[3].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 25.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5.0, 'angleWidth': 10, '@id': None}}))
-        self.assertEqual(x[3].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                                [ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 12.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                              "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}}), 
-                                 ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 347.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                              "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}})]
-                        )
-        self.assertIsNone(x[3].pointing_option)
-        # instrument 3, mode 3
-        self.assertEqual(x[4].instru_id, 'bs3')
-        self.assertIsNotNone(x[4].mode_id)        
-        self.assertEqual(x[4].scene_field_of_view, 
-                            ViewGeometry.from_dict({"orientation":{'referenceFrame': 'SC_BODY_FIXED', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': -25.0, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                         "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5.0, 'angleWidth': 10, '@id': None}}))
-        self.assertEqual(x[4].field_of_regard, # note that the field-of-regard is a list of ViewGeometry objects
-                                [ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 12.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                              "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}}), 
-                                 ViewGeometry.from_dict({"orientation":{'referenceFrame': 'NADIR_POINTING', 'convention': 'EULER', 'eulerAngle1': 0.0, 'eulerAngle2': 347.5, 'eulerAngle3': 0.0, 'eulerSeq1': 1, 'eulerSeq2': 2, 'eulerSeq3': 3, '@id': None}, 
-                                              "sphericalGeometry":{'shape': 'RECTANGULAR', 'angleHeight': 5, 'angleWidth': 15, '@id': None}})]
-                        )
-        self.assertIsNone(x[4].pointing_option)
-      
+        self._assert_cov_params(self.cov_params_spc1, _EXPECTED_SPC1)
+        self._assert_cov_params(self.cov_params_spc2, _EXPECTED_SPC2)
+        self._assert_cov_params(self.cov_params_spc3, _EXPECTED_SPC3)
     
+    def _assert_find_in_cov_params_list(self, cov_param_list, queries):
+        """ Check the entries found for the input valid (instru_id, mode_id, expected index) queries, and that invalid ids raise an exception."""
+        for (instru_id, mode_id, idx) in queries:
+            with self.subTest(instru_id=instru_id, mode_id=mode_id):
+                self.assertEqual(find_in_cov_params_list(cov_param_list=cov_param_list, instru_id=instru_id, mode_id=mode_id), 
+                                 cov_param_list[idx])
+        for (instru_id, mode_id) in [('axe', '1'), # invalid sensor-id
+                                     ('bs1', '1')]: # invalid mode-id
+            with self.subTest(instru_id=instru_id, mode_id=mode_id):
+                with self.assertRaisesRegex(Exception, 'was not found'):
+                    find_in_cov_params_list(cov_param_list=cov_param_list, instru_id=instru_id, mode_id=mode_id)
+
     def test_find_in_cov_params_list(self):
         # spc1 spacecraft, 1 instrument, 1 mode
-        spc1 = Spacecraft.from_json(spc1_json) 
-        cov_param_list = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc1)
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs1', mode_id='0'), 
-                         cov_param_list[0])
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id=None, mode_id=None), 
-                         cov_param_list[0])
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs1', mode_id=None), 
-                         cov_param_list[0])
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id=None, mode_id='0'), 
-                         cov_param_list[0])
-        with self.assertRaises(Exception):
-            orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='axe', mode_id='1') # invalid sensor-id
-            orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs1', mode_id='1') # invalid mode-id
+        self._assert_find_in_cov_params_list(self.cov_params_spc1, _FIND_QUERIES_SPC1)
 
         # spc2 spacecraft, no instruments 
-        spc2 = Spacecraft.from_json(spc2_json)
-        cov_param_list = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc2)
-        with self.assertRaises(Exception):
-            self.assertIsNone(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list)) # empty cov_param_list since spc2 has no instruments
+        with self.assertRaisesRegex(Exception, 'is empty'):
+            find_in_cov_params_list(cov_param_list=self.cov_params_spc2) # empty cov_param_list since spc2 has no instruments
 
         # spc3 spacecraft, 3 instruments, 1st and 2nd instrument have 1 mode and 3rd instrument has 3 modes 
-        spc3 = Spacecraft.from_json(spc3_json)
-        cov_param_list = orbitpy.coveragecalculator.helper_extract_coverage_parameters_of_spacecraft(spc3)
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs3', mode_id=1), 
-                         cov_param_list[3])
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs3', mode_id=None), 
-                         cov_param_list[2])
-        self.assertEqual(orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id=None, mode_id=None), 
-                         cov_param_list[0])
-        with self.assertRaises(Exception):
-            orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='axe', mode_id='1') # invalid sensor-id
-            orbitpy.coveragecalculator.find_in_cov_params_list(cov_param_list=cov_param_list, instru_id='bs1', mode_id='1') # invalid mode-id
+        self._assert_find_in_cov_params_list(self.cov_params_spc3, _FIND_QUERIES_SPC3)
 
     def test_filter_mid_interval_access(self):
         """ Check the behavior of this function is as expected using pre-run results.
         """
         
         # file input, file output
-        inp_acc_fl = self.dir_path + '/../test_data/accessData.csv'
-        out_acc_fl = self.out_dir + '/test_filter_mid_interval_access.csv' 
-        true_mid_interval_acc_fl = self.dir_path + '/../test_data/midIntervalAccessData.csv'
-        orbitpy.coveragecalculator.filter_mid_interval_access(inp_acc_fl=inp_acc_fl, out_acc_fl=out_acc_fl)
-        result_df = pd.read_csv(out_acc_fl, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-        truth_df = pd.read_csv(true_mid_interval_acc_fl, skiprows = [0,1,2,3])
-        self.assertTrue(result_df.equals(truth_df))
+        out_acc_fl = os.path.join(self.out_dir, 'test_filter_mid_interval_access.csv')
+        filter_mid_interval_access(inp_acc_fl=self.inp_acc_fl, out_acc_fl=out_acc_fl)
+        result_df = _read_access_csv(out_acc_fl)
+        assert_frame_equal(result_df, self.truth_mid_interval_acc_df, check_exact=True)
         
-        # dataframe input, dataframe output
-        inp_data = { 'time index': [ 0,  1,  2,  3,  4,  4,  4,  5,  5,  6,  6,  7,  8], 
-                     'GP index'  : [10, 11, 11, 11, 12, 13, 14, 12, 13, 12, 10, 10, 11],
-                     'lat [deg]' : [10.0, 11.0, 11.0, 11.0, 12.0, 13.0, 14.0, 12.0, 13.0, 12.0, 10.0, 10.0, 11.0],
-                     'lon [deg]':  [10.0, 11.0, 11.0, 11.0, 12.0, 13.0, 14.0, 12.0, 13.0, 12.0, 10.0, 10.0, 11.0]}    
-        inp_acc_df = pd.DataFrame(data = inp_data) 
-        truth_df = pd.DataFrame({ 'time index': [  0,  2,  4,  4,  5,   7,  8 ], 
-                                  'GP index'  : [ 10, 11, 13,  14, 12, 10, 11 ],
-                                   'lat [deg]' : [10.0, 11.0, 13.0,  14.0, 12.0, 10.0, 11.0],
-                                   'lon [deg]' : [10.0, 11.0, 13.0,  14.0, 12.0, 10.0, 11.0]})
-        result_df = orbitpy.coveragecalculator.filter_mid_interval_access(inp_acc_df=inp_acc_df)
-        self.assertTrue(result_df.equals(truth_df))
+        # dataframe input, dataframe output (a copy of the shared input is passed so that it is not modified)
+        result_df = filter_mid_interval_access(inp_acc_df=self.mid_interval_inp_acc_df.copy())
+        assert_frame_equal(result_df, self.mid_interval_truth_df, check_exact=True)
 
+    @unittest.skip("TODO: test of extract_auxillary_info_from_state_file not implemented.")
     def test_extract_auxillary_info_from_state_file(self): #TODO
         pass
 
+# built-in coverage calculators which are registered in the factory: (coverage calculator type label, coverage calculator class)
+_BUILTIN_COVERAGE_CALCULATORS = [('GRID COVERAGE', GridCoverage),
+                                 ('POINTING OPTIONS COVERAGE', PointingOptionsCoverage),
+                                 ('POINTING OPTIONS WITH GRID COVERAGE', PointingOptionsWithGridCoverage)]
+
 class TestCoverageCalculatorFactory(unittest.TestCase):
   
     class DummyNewCoverageCalculator:
@@ -209,19 +197,22 @@ class TestCoverageCalculatorFactory(unittest.TestCase):
         def from_dict(self):
             return TestCoverageCalculatorFactory.DummyNewCoverageCalculator()
 
-    def test___init__(self):
-        factory = CoverageCalculatorFactory()
+    @classmethod
+    def setUpClass(cls):
+        # build the factory (and register the built-in coverage calculators) once. The shared factory is only read by the tests, 
+        # tests which register new coverage calculators build their own factory.
+        cls.factory = CoverageCalculatorFactory()
 
+    def _assert_builtins_registered(self, factory):
+        """ Check that the built-in coverage calculators are registered in the input factory."""
+        for (_type, creator) in _BUILTIN_COVERAGE_CALCULATORS:
+            with self.subTest(_type=_type):
+                self.assertIn(_type, factory._creators)
+                self.assertIs(factory._creators[_type], creator)
+
+    def test___init__(self):
         # test the built-in coverage calculators are registered
-        # GRID COVERAGE
-        self.assertIn('GRID COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['GRID COVERAGE'], GridCoverage)
-        # POINTING OPTIONS COVERAGE
-        self.assertIn('POINTING OPTIONS COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['POINTING OPTIONS COVERAGE'], PointingOptionsCoverage)
-        # POINTING OPTIONS WITH GRID COVERAGE
-        self.assertIn('POINTING OPTIONS WITH GRID COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['POINTING OPTIONS WITH GRID COVERAGE'], PointingOptionsWithGridCoverage)
+        self._assert_builtins_registered(self.factory)
 
     def test_register_coverage_calculator(self):
         factory = CoverageCalculatorFactory()
@@ -229,40 +220,22 @@ class TestCoverageCalculatorFactory(unittest.TestCase):
         self.assertIn('New Cov Calc', factory._creators)
         self.assertEqual(factory._creators['New Cov Calc'], TestCoverageCalculatorFactory.DummyNewCoverageCalculator)
         # test the built-in coverage calculator remain registered after registration of new coverage calculator
-        # GRID COVERAGE
-        self.assertIn('GRID COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['GRID COVERAGE'], GridCoverage)
-        # POINTING OPTIONS COVERAGE
-        self.assertIn('POINTING OPTIONS COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['POINTING OPTIONS COVERAGE'], PointingOptionsCoverage)
-        # POINTING OPTIONS WITH GRID COVERAGE
-        self.assertIn('POINTING OPTIONS WITH GRID COVERAGE', factory._creators)
-        self.assertEqual(factory._creators['POINTING OPTIONS WITH GRID COVERAGE'], PointingOptionsWithGridCoverage)
+        self._assert_builtins_registered(factory)
 
     def test_get_coverage_calculator(self):
         
-        factory = CoverageCalculatorFactory()
-        # register dummy coverage calculator
-        factory.register_coverage_calculator('New Coverage Calc', TestCoverageCalculatorFactory.DummyNewCoverageCalculator)
-        
         # test the coverage calculator model classes can be obtained depending on the input specifications
-        # GRID COVERAGE
-        specs = {"@type": 'Grid coverage'} # in practice additional coverage calculator specs shall be present in the dictionary
-        grid_cov = factory.get_coverage_calculator(specs)
-        self.assertIsInstance(grid_cov, GridCoverage)
-        # POINTING OPTIONS COVERAGE
-        specs = {"@type": 'pointing OPTIONS COVERAGE'} # in practice additional coverage calculator specs shall be present in the dictionary
-        popt_cov = factory.get_coverage_calculator(specs)
-        self.assertIsInstance(popt_cov, PointingOptionsCoverage)
-        # POINTING OPTIONS WITH GRID COVERAGE
-        specs = {"@type": 'POINTING OpTiOns with GRID coverage'} # in practice additional coverage calculator specs shall be present in the dictionary
-        popt_with_grid_cov = factory.get_coverage_calculator(specs)
-        self.assertIsInstance(popt_with_grid_cov, PointingOptionsWithGridCoverage)
+        # (in practice additional coverage calculator specs shall be present in the dictionary)
+        for (_type, creator) in [('Grid coverage', GridCoverage),
+                                 ('pointing OPTIONS COVERAGE', PointingOptionsCoverage),
+                                 ('POINTING OpTiOns with GRID coverage', PointingOptionsWithGridCoverage)]:
+            with self.subTest(_type=_type):
+                self.assertIsInstance(self.factory.get_coverage_calculator({"@type": _type}), creator)
 
         # DummyNewCoverageCalculator
-        specs = {"@type": 'New Coverage Calc'} # in practice additional coverage calculator specs shall be present in the dictionary
-        new_cov = factory.get_coverage_calculator(specs)
-        self.assertIsInstance(new_cov, TestCoverageCalculatorFactory.DummyNewCoverageCalculator)
+        factory = CoverageCalculatorFactory()
+        factory.register_coverage_calculator('New Coverage Calc', TestCoverageCalculatorFactory.DummyNewCoverageCalculator)
+        self.assertIsInstance(factory.get_coverage_calculator({"@type": 'New Coverage Calc'}), TestCoverageCalculatorFactory.DummyNewCoverageCalculator)
 
 class TestCoverageOutputInfo(unittest.TestCase): #TODO
     pass
\ No newline at end of file
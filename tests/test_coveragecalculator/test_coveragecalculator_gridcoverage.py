@@ -16,9 +16,11 @@
 """
 
 import json
-import os, shutil
+import os
 import sys
 import unittest
+import functools
+import itertools
 import numpy as np
 import pandas as pd
 import random
@@ -36,25 +38,95 @@ from instrupy import Instrument
 
 sys.path.append('../')
 from util.spacecrafts import spc1_json, spc2_json, spc3_json, spc4_json, spc5_json
+from util.helpers import make_out_dir, propagate
 
 RE = 6378.137 # radius of Earth in kilometers
-    
+
+# spacecraft-bus aligned to the NADIR_POINTING frame
+_BUS_NADIR = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
+# (near) equatorial orbit used in the roll tests
+_ORBIT_EQ_RAAN20 = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
+                    "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
+                             "ecc": 0.001, "inc": 0, "raan": 20, 
+                             "aop": 0, "ta": 120}
+                   }
+# inclined orbit used in the pitch tests
+_ORBIT_INC45 = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
+                "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
+                         "ecc": 0.001, "inc": 45, "raan": 245, 
+                         "aop": 0, "ta": 0}
+               }
+
+# attributes of the coverage output info which are common to all the (FOV, JD 2458265.0 start-date) simulations in the tests.
+_GRID_COV_OUT_INFO = {"@type": "CoverageOutputInfo", "coverageType": "GRID COVERAGE", "usedFieldOfRegard": False, 
+                      "filterMidIntervalAccess": False, "startDate": 2458265.00000, "@id":None}
+
+@functools.lru_cache(maxsize=16)
+def _grid_from_key(key):
+    return Grid.from_autogrid_dict(json.loads(key))
+
+def _make_grid(d):
+    """ Build the grid from the autogrid specifications dictionary. The result is cached (keyed on the canonical JSON serialization 
+        of the dictionary) so that tests sharing the same grid specifications do not regenerate the grid-points.
+    """
+    return _grid_from_key(json.dumps(d, sort_keys=True))
+
+@functools.lru_cache(maxsize=64)
+def _spacecraft_from_key(key):
+    return Spacecraft.from_dict(json.loads(key))
+
+def _make_spacecraft(d):
+    """ Build the spacecraft from the spacecraft specifications dictionary. The result is cached (keyed on the canonical JSON serialization 
+        of the dictionary) so that simulations with the same spacecraft specifications do not re-parse them.
+    """
+    return _spacecraft_from_key(json.dumps(d, sort_keys=True))
+
+_read_access_csv = functools.partial(pd.read_csv, skiprows = [0,1,2,3]) # reader of access files: 5th row header, 6th row onwards contains the data
+_TIME_GP_INDEX_COLS = ['time index', 'GP index'] # columns of the access data compared in the pitch tests (the lat/lon columns need not be parsed)
+
+def _access_empty(path):
+    """ Check if the access file has no data, i.e. it contains only the 4 metadata rows and the column headers row. 
+        Only the first few lines of the file are read.
+    """
+    with open(path) as f:
+        return len(list(itertools.islice(f, 6))) <= 5
+
+def _is_subset(df1, df2):
+    """ Check if every row of the ``df1`` dataframe is present in the ``df2`` dataframe (the rows are compared over all the columns).
+    """
+    return pd.MultiIndex.from_frame(df1).isin(pd.MultiIndex.from_frame(df2)).all()
+
 class TestGridCoverage(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Create new working directory to store output of all the class functions. 
+        # Create new (unique) working directory to store output of all the class functions.
         cls.dir_path = os.path.dirname(os.path.realpath(__file__))
-        cls.out_dir = os.path.join(cls.dir_path, 'temp')
-        if os.path.exists(cls.out_dir):
-            shutil.rmtree(cls.out_dir)
-        os.makedirs(cls.out_dir)
+        cls.out_dir = make_out_dir(cls, prefix='gridcov_')
 
         # make propagator
         factory = PropagatorFactory()
         cls.step_size = 1
         cls.j2_prop = factory.get_propagator({"@type": 'J2 ANALYTICAL PROPAGATOR', "stepSize": cls.step_size})
 
+        # cache of the propagated state files, keyed by the orbit-state and duration (see util.helpers.propagate)
+        cls._prop_cache = {}
+
+        # randomly setup orbit and sensor FOV used in test_execute_0(.). A seeded generator is used so that the inputs (and hence the 
+        # propagated states) are reproducible between runs.
+        rng = random.Random(42)
+        cls.test0_orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
+                                "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+rng.uniform(350,850), 
+                                        "ecc": 0, "inc": rng.uniform(0,180), "raan": rng.uniform(0,360), 
+                                        "aop": rng.uniform(0,360), "ta": rng.uniform(0,360)}
+                               }
+        cls.test0_fov_diameter = rng.uniform(5,35)
+
+        # most commonly used grid
+        cls.default_grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        # global grid (used in the FOV vs FOR and the DOUBLE_ROLL_ONLY maneuver tests)
+        cls.global_grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+
     def test_from_dict(self):
         o = GridCoverage.from_dict({ "grid":{"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2},
                                      "spacecraft": json.loads(spc1_json),
@@ -74,59 +146,47 @@ class TestGridCoverage(unittest.TestCase):
         """        
         # setup spacecraft with some parameters setup randomly     
         duration=0.05
-        orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+random.uniform(350,850), 
-                            "ecc": 0, "inc": random.uniform(0,180), "raan": random.uniform(0,360), 
-                            "aop": random.uniform(0,360), "ta": random.uniform(0,360)}
-                     }
+        orbit_dict = self.test0_orbit_dict
 
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "REF_FRAME_ALIGNED"}, 
-                                           "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": random.uniform(5,35) }, 
+                                           "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": self.test0_fov_diameter }, 
                                            "maneuver":{"maneuverType": "CIRCULAR", "diameter":10}, "@id":"bs1", "@type":"Basic Sensor"}
 
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
+        spacecraftBus_dict = _BUS_NADIR
 
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # generate grid object
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 1})
+        grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 1})
         # set output file path
         out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) # the first instrument, mode available in the spacecraft is considered for the coverage calculation.
 
         # check the outputs
-        cov_calc_type = pd.read_csv(out_file_access, nrows=1, header=None).astype(str) # 1st row contains the coverage calculation type
-        cov_calc_type = str(cov_calc_type[0][0])
+        with open(out_file_access) as f:
+            cov_calc_type = f.readline().strip() # 1st row contains the coverage calculation type
+            epoch_JDUT1 = float(f.readline().split()[3]) # 2nd row contains the epoch
+            _step_size = float(f.readline().split()[4]) # 3rd row contains the stepsize
+            _duration = float(f.readline().split()[4]) # 4th row contains the mission duration
+            column_headers = f.readline().strip().split(',') # 5th row contains the columns headers
+            access_data = pd.read_csv(f, header=None, names=column_headers) # 6th row onwards contains the data
         self.assertEqual(cov_calc_type, 'GRID COVERAGE')
-
-        epoch_JDUT1 = pd.read_csv(out_file_access, skiprows = [0], nrows=1, header=None).astype(str) # 2nd row contains the epoch
-        epoch_JDUT1 = float(epoch_JDUT1[0][0].split()[3])
         self.assertEqual(epoch_JDUT1, 2458265.0)
-
-        _step_size = pd.read_csv(out_file_access, skiprows = [0,1], nrows=1, header=None).astype(str) # 3rd row contains the stepsize
-        _step_size = float(_step_size[0][0].split()[4])
         self.assertAlmostEqual(_step_size, self.step_size)
-
-        _duration = pd.read_csv(out_file_access, skiprows = [0,1,2], nrows=1, header=None).astype(str) # 4th row contains the mission duration
-        _duration = float(_duration[0][0].split()[4])
         self.assertAlmostEqual(_duration, duration)
-
-        column_headers = pd.read_csv(out_file_access, skiprows = [0,1,2,3], nrows=1, header=None).astype(str) # 5th row contains the columns headers
-        self.assertEqual(column_headers.iloc[0][0],"time index")
-        self.assertEqual(column_headers.iloc[0][1],"GP index")
-        self.assertEqual(column_headers.iloc[0][2],"lat [deg]")
-        self.assertEqual(column_headers.iloc[0][3],"lon [deg]")
+        self.assertEqual(column_headers[0],"time index")
+        self.assertEqual(column_headers[1],"GP index")
+        self.assertEqual(column_headers[2],"lat [deg]")
+        self.assertEqual(column_headers[3],"lon [deg]")
 
         # check that the grid indices are interpreted correctly
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
         if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(lat==access_data['lat [deg]'].tolist())
-            self.assertTrue(lon==access_data['lon [deg]'].tolist())
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue(np.array_equal(lat, access_data['lat [deg]'].to_numpy()))
+            self.assertTrue(np.array_equal(lon, access_data['lon [deg]'].to_numpy()))
         else:
             warnings.warn('No data was generated in test_execute_0(.). Run the test again.')
     
@@ -136,48 +196,33 @@ class TestGridCoverage(unittest.TestCase):
         """ 
         ############ Common attributes for both positive and negative roll tests ############
         duration = 0.1
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        spacecraftBus_dict = _BUS_NADIR
+        grid = self.default_grid
         
-        orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
-                        "ecc": 0.001, "inc": 0, "raan": 20, 
-                        "aop": 0, "ta": 120}
-                     }
+        orbit_dict = _ORBIT_EQ_RAAN20
 
         ############ positive roll ############
         # setup spacecraft with some parameters setup randomly   
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "SIDE_LOOK", "sideLookAngle":12.5}, 
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)   
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        # execute propagator (the state file is reused by the other tests with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # set output file path
         out_file_access = self.out_dir+'/test_cov_accessX.csv'
         # run the coverage calculator
         cov = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file)
         out_info = cov.execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access)
-        self.assertEqual(out_info, CoverageOutputInfo.from_dict({"@type": "CoverageOutputInfo",
-                        "coverageType": "GRID COVERAGE",
-                        "spacecraftId": sat._id,
-                        "instruId": sat.get_instrument(None)._id,
-                        "modeId": sat.get_instrument(None).get_mode_id()[0],
-                        "usedFieldOfRegard": False,
-                        "filterMidIntervalAccess": False,
-                        "gridId": grid._id,
-                        "stateCartFile": state_cart_file,
-                        "accessFile": out_file_access,
-                        "startDate": 2458265.00000,
-                        "duration": duration, "@id":None}))        
+        self.assertEqual(out_info, CoverageOutputInfo.from_dict(dict(_GRID_COV_OUT_INFO, 
+                        spacecraftId=sat._id, instruId=sat.get_instrument(None)._id, modeId=sat.get_instrument(None).get_mode_id()[0],
+                        gridId=grid._id, stateCartFile=state_cart_file, accessFile=out_file_access, duration=duration)))        
         
         # check the outputs
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
-        
-        if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(all(x > 0 for x in lat))
+        if not _access_empty(out_file_access):
+            access_data = _read_access_csv(out_file_access)
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue((lat > 0).all())
         else:
             warnings.warn('No data was generated in test_execute_1(.) positive roll test. Run the test again.')
         
@@ -185,17 +230,17 @@ class TestGridCoverage(unittest.TestCase):
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "SIDE_LOOK", "sideLookAngle":-12.5}, 
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
         # no need to rerun propagator, since propagation does not depend on sensor
         # set output file path
         out_file_access = self.out_dir+'/test_cov_accessY.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access)   
         # check the outputs
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
-        if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(all(x < 0 for x in lat))
+        if not _access_empty(out_file_access):
+            access_data = _read_access_csv(out_file_access)
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue((lat < 0).all())
         else:
             warnings.warn('No data was generated in test_execute_1(.) negative roll test. Run the test again.')
         
@@ -210,9 +255,9 @@ class TestGridCoverage(unittest.TestCase):
                             "ecc": 0.001, "inc": 0, "raan": 0, 
                             "aop": 0, "ta": 0}
                      }
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
+        spacecraftBus_dict = _BUS_NADIR
         # generate grid object
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
+        grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
         
         pitch = 15
         roll = 10.5
@@ -223,31 +268,21 @@ class TestGridCoverage(unittest.TestCase):
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
 
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
+        # execute propagator (the state file is reused by the other tests with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         
         # set output file path
         out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         out_info = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) 
         
-        self.assertEqual(out_info, CoverageOutputInfo.from_dict({"@type": "CoverageOutputInfo",
-                        "coverageType": "GRID COVERAGE",
-                        "spacecraftId": sat._id,
-                        "instruId": sat.get_instrument(None)._id,
-                        "modeId": sat.get_instrument(None).get_mode_id()[0],
-                        "usedFieldOfRegard": False,
-                        "filterMidIntervalAccess": False,
-                        "gridId": grid._id,
-                        "stateCartFile": state_cart_file,
-                        "accessFile": out_file_access,
-                        "startDate": 2458265.00000,
-                        "duration": duration, "@id":None}))
-
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        self.assertEqual(out_info, CoverageOutputInfo.from_dict(dict(_GRID_COV_OUT_INFO, 
+                        spacecraftId=sat._id, instruId=sat.get_instrument(None)._id, modeId=sat.get_instrument(None).get_mode_id()[0],
+                        gridId=grid._id, stateCartFile=state_cart_file, accessFile=out_file_access, duration=duration)))
+
+        access_data1 = _read_access_csv(out_file_access)
 
         ######## Simulation 2 ########
         yaw = random.uniform(0,360)
@@ -255,7 +290,7 @@ class TestGridCoverage(unittest.TestCase):
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"sen1", "@type":"Basic Sensor"}
 
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
         # no need to rerun propagator, since propagation does not depend on sensor
         # set output file path
@@ -263,26 +298,17 @@ class TestGridCoverage(unittest.TestCase):
         # run the coverage calculator
         out_info = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) 
 
-        self.assertEqual(out_info, CoverageOutputInfo.from_dict({"@type": "CoverageOutputInfo",
-                        "coverageType": "GRID COVERAGE",
-                        "spacecraftId": sat._id,
-                        "instruId": "sen1",
-                        "modeId": "m1",
-                        "usedFieldOfRegard": False,
-                        "filterMidIntervalAccess": False,
-                        "gridId": grid._id,
-                        "stateCartFile": state_cart_file,
-                        "accessFile": out_file_access,
-                        "startDate": 2458265.00000,
-                        "duration": duration, "@id":None}))
-
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        self.assertEqual(out_info, CoverageOutputInfo.from_dict(dict(_GRID_COV_OUT_INFO, 
+                        spacecraftId=sat._id, instruId="sen1", modeId="m1",
+                        gridId=grid._id, stateCartFile=state_cart_file, accessFile=out_file_access, duration=duration)))
+
+        access_data2 = _read_access_csv(out_file_access)
 
         ######## compare the results of both the simulations ########    
         if not access_data1.empty:
-            (lat1, lon1) = grid.get_lat_lon_from_index(access_data1['GP index'].tolist())
-            (lat2, lon2) = grid.get_lat_lon_from_index(access_data2['GP index'].tolist())
-            self.assertTrue(lat1==lat2)
+            (lat1, lon1) = grid.get_lat_lon_from_index(access_data1['GP index'].to_numpy())
+            (lat2, lon2) = grid.get_lat_lon_from_index(access_data2['GP index'].to_numpy())
+            self.assertTrue(np.array_equal(lat1, lat2))
         else:
             warnings.warn('No data was generated in test_execute_2(.). Run the test again.')
     
@@ -293,33 +319,27 @@ class TestGridCoverage(unittest.TestCase):
         """ 
         ####### Common attributes for all the simulations #######
         duration = 0.1
-        orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
-                            "ecc": 0.001, "inc": 45, "raan": 245, 
-                            "aop": 0, "ta": 0}
-                     }
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
+        orbit_dict = _ORBIT_INC45
+        spacecraftBus_dict = _BUS_NADIR
         # generate grid object
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
-        grid.write_to_file(self.out_dir+'/grid.csv')
+        grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
         ######## Simulation 1 #######
         pitch = 0
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": 0, "zRotation": 0}, 
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
 
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, out_file_cart=state_cart_file, duration=duration)
+        # execute propagator (the state file is reused by the other tests with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
 
         # set output file path
-        out_file_access = self.out_dir+'/test_cov_access1.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) 
         
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data1 = _read_access_csv(out_file_access, usecols=_TIME_GP_INDEX_COLS)
 
         
         ######## Simulation 2 #######
@@ -328,16 +348,15 @@ class TestGridCoverage(unittest.TestCase):
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
 
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # no need to rerun propagator, since propagation does not depend on sensor
         # set output file path
-        out_file_access = self.out_dir+'/test_cov_access2.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) 
         
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data2 = _read_access_csv(out_file_access, usecols=_TIME_GP_INDEX_COLS)
 
         ######## Simulation 3 #######
         pitch = -25
@@ -345,16 +364,15 @@ class TestGridCoverage(unittest.TestCase):
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
 
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # no need to rerun propagator, since propagation does not depend on sensor
         # set output file path
-        out_file_access = self.out_dir+'/test_cov_access3.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access) 
         
-        access_data3 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data3 = _read_access_csv(out_file_access, usecols=_TIME_GP_INDEX_COLS)
 
         ######## compare the results of both the simulations ########   
         # the first gpi in pitch forward pitch case is detected earlier than in the zero pitch case and (both) earlier than the pitch backward case
@@ -373,35 +391,29 @@ class TestGridCoverage(unittest.TestCase):
         """ 
         ############ Common attributes for both positive and negative roll tests ############
         duration = 0.1
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        spacecraftBus_dict = _BUS_NADIR
+        grid = self.default_grid
         
-        orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                                       "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
-                                                "ecc": 0.001, "inc": 0, "raan": 20, 
-                                                "aop": 0, "ta": 120}
-                                       }
+        orbit_dict = _ORBIT_EQ_RAAN20
 
         ############ positive roll ############
         # setup spacecraft with some parameters setup randomly   
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "SIDE_LOOK", "sideLookAngle":12.5}, 
                                            "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, out_file_cart=state_cart_file, duration=duration)   
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        # execute propagator (the state file is reused by the other tests with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # set output file path
         out_file_access = self.out_dir+'/test_cov_accessX.csv'
         # run the coverage calculator
         cov = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file)
         cov.execute(out_file_access=out_file_access)     
         # check the outputs
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
-        
-        if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(all(x > 0 for x in lat))
+        if not _access_empty(out_file_access):
+            access_data = _read_access_csv(out_file_access)
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue((lat > 0).all())
         else:
             warnings.warn('No data was generated in test_execute_1(.) positive roll test. Run the test again.')
         
@@ -409,17 +421,17 @@ class TestGridCoverage(unittest.TestCase):
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "SIDE_LOOK", "sideLookAngle":-12.5}, 
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 25 }, 
                                            "@id":"bs1", "@type":"Basic Sensor"}
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+        sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
         # no need to rerun propagator, since propagation does not depend on sensor
         # set output file path
         out_file_access = self.out_dir+'/test_cov_accessY.csv'
         # run the coverage calculator
         GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, use_field_of_regard=False, out_file_access=out_file_access)   
         # check the outputs
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
-        if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(all(x < 0 for x in lat))
+        if not _access_empty(out_file_access):
+            access_data = _read_access_csv(out_file_access)
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue((lat < 0).all())
         else:
             warnings.warn('No data was generated in test_execute_1(.) negative roll test. Run the test again.')        
     
@@ -430,71 +442,28 @@ class TestGridCoverage(unittest.TestCase):
         """ 
         ####### Common attributes for all the simulations #######
         duration = 0.1
-        orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+500, 
-                            "ecc": 0.001, "inc": 45, "raan": 245, 
-                            "aop": 0, "ta": 0}
-                     }
-        spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
+        orbit_dict = _ORBIT_INC45
+        spacecraftBus_dict = _BUS_NADIR
         # generate grid object
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
-        grid.write_to_file(self.out_dir+'/grid.csv')
-        ######## Simulation 1 #######
-        pitch = 0
-        instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": 0, "zRotation": 0}, 
-                                           "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 },   
-                                           "@id":"bs1", "@type":"Basic Sensor"}
-
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
-
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        #factory = PropagatorFactory()
-        #prop = factory.get_propagator({"@type": 'J2 ANALYTICAL PROPAGATOR', "stepSize": 1})
-        #prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
-
-        # set output file path
-        out_file_access = self.out_dir+'/test_cov_access1.csv'
-        # run the coverage calculator
-        GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(out_file_access=out_file_access) 
-        
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-
-        
-        ######## Simulation 2 #######
-        pitch = 25
-        instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": 0, "zRotation": 0}, 
-                                           "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 },  
-                                           "@id":"bs1", "@type":"Basic Sensor"}
-
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
-
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # no need to rerun propagator, since propagation does not depend on sensor
-        # set output file path
-        out_file_access = self.out_dir+'/test_cov_access2.csv'
-        # run the coverage calculator
-        GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, out_file_access=out_file_access) 
-        
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-
-        ######## Simulation 3 #######
-        pitch = -25
-        instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": 0, "zRotation": 0}, 
-                                           "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 },  
-                                           "@id":"bs1", "@type":"Basic Sensor"}
-
-        sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
-
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # no need to rerun propagator, since propagation does not depend on sensor
-        # set output file path
-        out_file_access = self.out_dir+'/test_cov_access3.csv'
-        # run the coverage calculator
-        GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(mode_id=None, out_file_access=out_file_access) 
-        
-        access_data3 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        grid = _make_grid({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 5})
+
+        def simulate(pitch, **kwargs):
+            """ Run the coverage calculator for the sensor with the input pitch and return the access data. """
+            instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": 0, "zRotation": 0}, 
+                                               "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 },   
+                                               "@id":"bs1", "@type":"Basic Sensor"}
+            sat = _make_spacecraft({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
+            # execute propagator (propagation does not depend on sensor, hence the state file is reused across the simulations)
+            state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
+            # run the coverage calculator (the access file is read back before the next simulation overwrites it)
+            out_file_access = self.out_dir+'/test_cov_access.csv'
+            GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file).execute(out_file_access=out_file_access, **kwargs)
+            return _read_access_csv(out_file_access, usecols=_TIME_GP_INDEX_COLS)
+
+        ######## Simulations 1, 2, 3 #######
+        access_data1 = simulate(0)
+        access_data2 = simulate(25, instru_id=None)
+        access_data3 = simulate(-25, mode_id=None)
 
         ######## compare the results of both the simulations ########   
         # the first gpi in pitch forward pitch case is detected earlier than in the zero pitch case and (both) earlier than the pitch backward case
@@ -514,7 +483,7 @@ class TestGridCoverage(unittest.TestCase):
         ############ Common attributes for both simulations ############
         duration = 0.1
         
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        grid = self.default_grid
         
         orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
                       "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+750, 
@@ -530,32 +499,30 @@ class TestGridCoverage(unittest.TestCase):
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": 0, "yRotation": 0, "zRotation": 0}, 
                                            "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 }, "@id":"bs1", "@type":"Basic Sensor"}
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "spacecraftBus": spacecraftBus_dict, "instrument": instrument_dict})
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, out_file_cart=state_cart_file, duration=duration)   
+        # execute propagator (the state file is reused by the other simulations with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # set output file path
-        out_file_access = self.out_dir+'/test_cov_access1.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         cov = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file)
         cov.execute(instru_id='bs1', out_file_access=out_file_access)     
         # check the outputs
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
+        access_data1 = _read_access_csv(out_file_access)
         
         ############ simulation with orienting sensor w.r.t spacecraft and spacecraft aligned to NADIR_POINTING frame ############        
         spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation": 0, "yRotation": 0, "zRotation": 0}}
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "XYZ", "xRotation": pitch, "yRotation": roll, "zRotation": yaw}, 
                                            "fieldOfViewGeometry": {"shape": "rectangular", "angleHeight": 15, "angleWidth": 25 }, "@id":"bs1", "@type":"Basic Sensor"}
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "spacecraftBus": spacecraftBus_dict, "instrument": instrument_dict})
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=sat, out_file_cart=state_cart_file, duration=duration)   
+        # execute propagator (the state file is reused by the other simulations with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # set output file path
-        out_file_access = self.out_dir+'/test_cov_access2.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         # run the coverage calculator
         cov = GridCoverage(grid=grid, spacecraft=sat, state_cart_file=state_cart_file)
         cov.execute(instru_id='bs1', out_file_access=out_file_access)     
         # check the outputs
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data    
+        access_data2 = _read_access_csv(out_file_access)
 
         ############ compare both outputs ############
         if not access_data1.empty:
@@ -573,12 +540,11 @@ class TestGridCoverage(unittest.TestCase):
         """
         duration = 0.1
         
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        grid = self.default_grid
         
         spc4 = Spacecraft.from_json(spc4_json)
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=spc4, out_file_cart=state_cart_file, duration=duration)   
+        # execute propagator (the state file is reused by the other simulations with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, spc4, duration)
         # set output file path
         out_file_access = self.out_dir+'/test_cov_access.csv'
         # form the coverage calculator object
@@ -586,39 +552,39 @@ class TestGridCoverage(unittest.TestCase):
 
         # run the different simulations
         cov.execute(instru_id='bs1', out_file_access=out_file_access) 
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data   
+        access_data1 = _read_access_csv(out_file_access)
         
         cov.execute(instru_id='bs2', mode_id=101, out_file_access=out_file_access) 
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data    
+        access_data2 = _read_access_csv(out_file_access)
 
         cov.execute(instru_id='bs3', mode_id=0, out_file_access=out_file_access) 
-        access_data3_1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data  
+        access_data3_1 = _read_access_csv(out_file_access)
 
         cov.execute(instru_id='bs3', mode_id="roll_pos", out_file_access=out_file_access) 
-        access_data3_2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data  
+        access_data3_2 = _read_access_csv(out_file_access)
 
         cov.execute(instru_id='bs3', mode_id="roll_neg", out_file_access=out_file_access) 
-        access_data3_3 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data  
+        access_data3_3 = _read_access_csv(out_file_access)
 
         # compare attributes of the output data from the different simulations
         if not access_data1.empty:
             self.assertTrue(len(access_data1.index) < len(access_data2.index) < len(access_data3_1.index))
-            # this test checks if access_data1 Dataframe is subset of access_data2 dataframe. Note that it will not work if there are duplicated rows in any one of the dataframes.
-            self.assertEqual(len(access_data1.merge(access_data2)), len(access_data1)) 
-            # this test checks if access_data2 Dataframe is subset of access_data3 dataframe. Note that it will not work if there are duplicated rows in any one of the dataframes.
-            self.assertEqual(len(access_data2.merge(access_data3_1)), len(access_data2)) 
+            # this test checks if access_data1 Dataframe is subset of access_data2 dataframe (i.e. every row of access_data1 is present in access_data2).
+            self.assertTrue(_is_subset(access_data1, access_data2))
+            # this test checks if access_data2 Dataframe is subset of access_data3 dataframe (i.e. every row of access_data2 is present in access_data3).
+            self.assertTrue(_is_subset(access_data2, access_data3_1))
         else:
             warnings.warn('No data was generated in test_execute_7(.). Run the test again.')
 
         if not access_data3_2.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data3_2['GP index'].tolist())
-            self.assertTrue(all(x > 0 for x in lat))
+            (lat, lon) = grid.get_lat_lon_from_index(access_data3_2['GP index'].to_numpy())
+            self.assertTrue((lat > 0).all())
         else:
             warnings.warn('No data was generated in test_execute_7(.) positive roll test. Run the test again.')
         
         if not access_data3_3.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data3_3['GP index'].tolist())
-            self.assertTrue(all(x < 0 for x in lat))
+            (lat, lon) = grid.get_lat_lon_from_index(access_data3_3['GP index'].to_numpy())
+            self.assertTrue((lat < 0).all())
         else:
             warnings.warn('No data was generated in test_execute_7(.) negative roll test. Run the test again.')
     
@@ -629,31 +595,30 @@ class TestGridCoverage(unittest.TestCase):
         """
         duration = 0.1
         
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        grid = self.global_grid
         
         spc1 = Spacecraft.from_json(spc1_json)
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=spc1, out_file_cart=state_cart_file, duration=duration)   
+        # execute propagator (the state file is reused by the other simulations with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, spc1, duration)
         
         # form the coverage calculator object
         cov = GridCoverage(grid=grid, spacecraft=spc1, state_cart_file=state_cart_file)
         
         # run the coverage calculator: FOV considered
-        out_file_access = self.out_dir+'/test_cov_access1.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         cov.execute(instru_id='bs1', use_field_of_regard=False, out_file_access=out_file_access)
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data1 = _read_access_csv(out_file_access)
 
         # run the coverage calculator: FOR considered
-        out_file_access = self.out_dir+'/test_cov_access2.csv'               
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         cov.execute(instru_id='bs1', use_field_of_regard=True, out_file_access=out_file_access) 
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data2 = _read_access_csv(out_file_access)
 
          # compare attributes of the output data from the different simulations
         if not access_data1.empty:
             self.assertTrue(len(access_data1.index) < len(access_data2.index))
-            # this test checks if access_data1 Dataframe is subset of access_data2 dataframe. Note that it will not work if there are duplicated rows in any one of the dataframes.
-            self.assertEqual(len(access_data1.merge(access_data2)), len(access_data1)) 
+            # this test checks if access_data1 Dataframe is subset of access_data2 dataframe (i.e. every row of access_data1 is present in access_data2).
+            self.assertTrue(_is_subset(access_data1, access_data2))
         else:
             warnings.warn('No data was generated in test_execute_8(.). Run the test again.')
 
@@ -668,36 +633,33 @@ class TestGridCoverage(unittest.TestCase):
         """
         duration = 0.1
         
-        grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 2})
+        grid = self.global_grid
         
         spc5 = Spacecraft.from_json(spc5_json)
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
-        # execute propagator
-        self.j2_prop.execute(spacecraft=spc5, out_file_cart=state_cart_file, duration=duration)          
+        # execute propagator (the state file is reused by the other simulations with the same orbit)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, spc5, duration)
 
         # form the coverage calculator object
         cov = GridCoverage(grid=grid, spacecraft=spc5, state_cart_file=state_cart_file)
 
         # run mode with SINGLE_ROLL_ONLY manuever (positive)
-        out_file_access = self.out_dir+'/test_cov_access1.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         cov.execute(instru_id="sen1", mode_id=0, use_field_of_regard=True, out_file_access=out_file_access)
-        access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data1 = _read_access_csv(out_file_access)
 
         # run mode with SINGLE_ROLL_ONLY manuever (negative)
-        out_file_access = self.out_dir+'/test_cov_access2.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         cov.execute(instru_id="sen1", mode_id=1, use_field_of_regard=True, out_file_access=out_file_access)
-        access_data2 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data2 = _read_access_csv(out_file_access)
 
         # run mode with DOUBLE_ROLL_ONLY manuever
-        out_file_access = self.out_dir+'/test_cov_access3.csv'
+        out_file_access = self.out_dir+'/test_cov_access.csv'
         cov.execute(instru_id="sen1", mode_id=2, use_field_of_regard=True, out_file_access=out_file_access)
-        access_data3 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
+        access_data3 = _read_access_csv(out_file_access)
 
         # compare the results from the different simulations
-        # join access_data1, access_data_2
-        dfs = [access_data1, access_data2]
-        df = pd.concat( dfs,axis=0,ignore_index=True)
-        self.assertTrue(access_data3.equals(df))
+        # the rows of access_data3 should be the rows of access_data1 followed by the rows of access_data2
+        self.assertTrue(np.array_equal(access_data3.to_numpy(), np.concatenate((access_data1.to_numpy(), access_data2.to_numpy()))))
 
 
 
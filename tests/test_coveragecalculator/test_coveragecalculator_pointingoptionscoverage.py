@@ -11,14 +11,13 @@ TODO: tests to check behavior with multiple sensors, modes
 """
 
 import json
-import os, shutil
+import os
 import sys
 import unittest
 import numpy as np
 import pandas as pd
 import random
 import warnings 
-import json 
 
 import propcov
 from orbitpy.coveragecalculator import CoverageCalculatorFactory, CoverageOutputInfo, PointingOptionsCoverage
@@ -32,6 +31,7 @@ from instrupy import Instrument
 
 sys.path.append('../')
 from util.spacecrafts import spc1_json, spc2_json, spc3_json, spc4_json, spc5_json
+from util.helpers import make_out_dir
 
 RE = 6378.137 # radius of Earth in kilometers
     
@@ -39,12 +39,9 @@ class TestPointingOptionsCoverage(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Create new working directory to store output of all the class functions. 
+        # Create new (unique) working directory to store output of all the class functions.
         cls.dir_path = os.path.dirname(os.path.realpath(__file__))
-        cls.out_dir = os.path.join(cls.dir_path, 'temp')
-        if os.path.exists(cls.out_dir):
-            shutil.rmtree(cls.out_dir)
-        os.makedirs(cls.out_dir)
+        cls.out_dir = make_out_dir(cls, prefix='pntoptcov_')
 
         # make propagator
         factory = PropagatorFactory()
@@ -66,12 +63,14 @@ class TestPointingOptionsCoverage(unittest.TestCase):
     def test_execute_0(self):
         """ Check the produced access file format.
         """        
-        # setup spacecraft with some parameters setup randomly     
-        duration=random.random()
+        # setup spacecraft with some parameters setup randomly. A seeded generator is used so that the inputs are reproducible, and the 
+        # duration is kept short since only the format of the output file is checked.
+        rng = random.Random(0)
+        duration=rng.uniform(0.01, 0.05)
         orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
-                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+random.uniform(350,850), 
-                            "ecc": 0, "inc": random.uniform(0,180), "raan": random.uniform(0,360), 
-                            "aop": random.uniform(0,360), "ta": random.uniform(0,360)}
+                      "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+rng.uniform(350,850), 
+                            "ecc": 0, "inc": rng.uniform(0,180), "raan": rng.uniform(0,360), 
+                            "aop": rng.uniform(0,360), "ta": rng.uniform(0,360)}
                      }
 
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "REF_FRAME_ALIGNED"}, 
@@ -94,35 +93,29 @@ class TestPointingOptionsCoverage(unittest.TestCase):
         PointingOptionsCoverage(spacecraft=sat, state_cart_file=state_cart_file).execute(instru_id=None, mode_id=None, out_file_access=out_file_access) # the first instrument, mode available in the spacecraft is considered for the coverage calculation.
 
         # check the outputs
-        cov_calc_type = pd.read_csv(out_file_access, nrows=1, header=None).astype(str) # 1st row contains the coverage calculation type
-        cov_calc_type = str(cov_calc_type[0][0])
+        with open(out_file_access) as f:
+            cov_calc_type = f.readline().strip() # 1st row contains the coverage calculation type
+            epoch_JDUT1 = float(f.readline().split()[3]) # 2nd row contains the epoch
+            _step_size = float(f.readline().split()[4]) # 3rd row contains the stepsize
+            _duration = float(f.readline().split()[4]) # 4th row contains the mission duration
+            column_headers = f.readline().strip().split(',') # 5th row contains the columns headers
         self.assertEqual(cov_calc_type, 'POINTING OPTIONS COVERAGE')
-
-        epoch_JDUT1 = pd.read_csv(out_file_access, skiprows = [0], nrows=1, header=None).astype(str) # 2nd row contains the epoch
-        epoch_JDUT1 = float(epoch_JDUT1[0][0].split()[3])
         self.assertEqual(epoch_JDUT1, 2458265.0)
-
-        _step_size = pd.read_csv(out_file_access, skiprows = [0,1], nrows=1, header=None).astype(str) # 3rd row contains the stepsize
-        _step_size = float(_step_size[0][0].split()[4])
         self.assertAlmostEqual(_step_size, self.step_size)
-
-        _duration = pd.read_csv(out_file_access, skiprows = [0,1,2], nrows=1, header=None).astype(str) # 4th row contains the mission duration
-        _duration = float(_duration[0][0].split()[4])
         self.assertAlmostEqual(_duration, duration)
-
-        column_headers = pd.read_csv(out_file_access, skiprows = [0,1,2,3], nrows=1, header=None).astype(str) # 5th row contains the columns headers
-        self.assertEqual(column_headers.iloc[0][0],"time index")
-        self.assertEqual(column_headers.iloc[0][1],"pnt-opt index")
-        self.assertEqual(column_headers.iloc[0][2],"lat [deg]")
-        self.assertEqual(column_headers.iloc[0][3],"lon [deg]")
+        self.assertEqual(column_headers[0],"time index")
+        self.assertEqual(column_headers[1],"pnt-opt index")
+        self.assertEqual(column_headers[2],"lat [deg]")
+        self.assertEqual(column_headers[3],"lon [deg]")
     
     def test_execute_1(self):
         """ Test that the pointing euler-angles, euler-sequence (0,0,x, 1,2,3) (where x is variable). This corresponds to pointing at the 
             nadir position which shall be the same as the satellite position.
         """ 
-        # setup spacecraft with some parameters setup randomly     
+        # setup spacecraft with some parameters setup randomly (seeded generator so that the inputs are reproducible)
+        rng = random.Random(1)
         duration=0.1
-        sma = RE+random.uniform(350,850)
+        sma = RE+rng.uniform(350,850)
         orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
                       "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": sma, 
                             "ecc": 0, "inc": 56, "raan": 135, 
@@ -131,11 +124,7 @@ class TestPointingOptionsCoverage(unittest.TestCase):
 
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "REF_FRAME_ALIGNED"}, 
                                            "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 10}, 
-                                           "pointingOption":[{"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":random.uniform(0,360)},
-                                                             {"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":random.uniform(0,360)},
-                                                             {"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":random.uniform(0,360)},
-                                                             {"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":random.uniform(0,360)},
-                                                             {"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":random.uniform(0,360)}],
+                                           "pointingOption":[{"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":rng.uniform(0,360)} for _ in range(5)],
                                            "@id":"bs1", "@type":"Basic Sensor"}
 
         spacecraftBus_dict = {"orientation":{"referenceFrame": "NADIR_POINTING", "convention": "REF_FRAME_ALIGNED"}}
@@ -163,32 +152,38 @@ class TestPointingOptionsCoverage(unittest.TestCase):
                         "startDate": 2458265.00000,
                         "duration": duration, "@id":None}))
 
-        # extract satellite position data from state file
-        epoch_JDUT1 = pd.read_csv(out_file_access, skiprows = [0], nrows=1, header=None).astype(str) # 2nd row contains the epoch
-        epoch_JDUT1 = float(epoch_JDUT1[0][0].split()[3])
-        step_size = pd.read_csv(out_file_access, skiprows = [0,1], nrows=1, header=None).astype(str) # 3rd row contains the stepsize
-        step_size = float(step_size[0][0].split()[4])
+        # read the epoch, step-size and access data from the access file
+        with open(out_file_access) as f:
+            f.readline() # 1st row contains the coverage calculation type
+            epoch_JDUT1 = float(f.readline().split()[3]) # 2nd row contains the epoch
+            step_size = float(f.readline().split()[4]) # 3rd row contains the stepsize
+            f.readline() # 4th row contains the mission duration
+            access_data_df = pd.read_csv(f, usecols=['pnt-opt index', 'lat [deg]', 'lon [deg]'], 
+                                         dtype={'pnt-opt index': np.int64, 'lat [deg]': np.float64, 'lon [deg]': np.float64}) # 5th row header, 6th row onwards contains the data
 
-        states_df = pd.read_csv(state_cart_file, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-        states_df.set_index("time index")        
+        # extract satellite position data from state file
+        states_df = pd.read_csv(state_cart_file, skiprows = [0,1,2,3], usecols=['time index', 'x [km]', 'y [km]', 'z [km]'], 
+                                dtype={'time index': np.int64, 'x [km]': np.float64, 'y [km]': np.float64, 'z [km]': np.float64}) # 5th row header, 6th row onwards contains the data
 
+        # satellite positions and the corresponding times (JDUT1) as arrays (avoids building a pandas Series per row)
+        sat_pos = states_df[['x [km]', 'y [km]', 'z [km]']].to_numpy()
+        sat_jd = epoch_JDUT1 + states_df['time index'].to_numpy()*step_size*(1.0/86400.0)
         sat_lat = []
         sat_lon = []
-        for idx, state in states_df.iterrows():
-            [lat,lon,alt] = GeoUtilityFunctions.eci2geo([state['x [km]'], state['y [km]'], state['z [km]']], 
-                                                         epoch_JDUT1 + state['time index']*step_size*(1.0/86400.0))
-            sat_lat.append(round(lat, 2))
-            sat_lon.append(round(lon, 2))
-        # compare the results of the coverage calculation with the satellite position data
-        access_data_df = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-        # iterate over each pointing-option
-        access_data_grp = access_data_df.groupby('pnt-opt index') # group according to ground-point indices
-        # iterate over all the groups (ground-point indices)
-        for name, group in access_data_grp:
-            access_lat = group['lat [deg]'].to_numpy()
-            access_lon = group['lon [deg]'].to_numpy()
-            self.assertTrue(np.allclose(sat_lat, access_lat))
-            self.assertTrue(np.allclose(sat_lon, access_lon))
+        for pos, jd in zip(sat_pos.tolist(), sat_jd.tolist()):
+            [lat,lon,alt] = GeoUtilityFunctions.eci2geo(pos, jd)
+            sat_lat.append(lat)
+            sat_lon.append(lon)
+        # compare the results of the coverage calculation with the satellite position data (the access file lists lat/lon to 2 decimal places).
+        # The rows are written for each time-step, for each pointing-option, so the access data is reshaped to (time-steps x pointing-options) 
+        # and compared against the satellite position broadcast over all the pointing-options.
+        n_po = len(instrument_dict["pointingOption"])
+        pnt_opt_idx = access_data_df['pnt-opt index'].to_numpy().reshape(-1, n_po)
+        access_lat = access_data_df['lat [deg]'].to_numpy().reshape(-1, n_po)
+        access_lon = access_data_df['lon [deg]'].to_numpy().reshape(-1, n_po)
+        self.assertTrue(np.array_equal(pnt_opt_idx, np.broadcast_to(np.arange(n_po), pnt_opt_idx.shape)))
+        self.assertTrue(np.allclose(access_lat, np.asarray(sat_lat)[:, np.newaxis], atol=1e-2))
+        self.assertTrue(np.allclose(access_lon, np.asarray(sat_lon)[:, np.newaxis], atol=1e-2))
     
     def test_execute_2(self):
         """ Test that the pointing for the case of equatorial orbit at randomly chosen altitudes. Pointing to the nadir with any random yaw shall result
@@ -196,20 +191,21 @@ class TestPointingOptionsCoverage(unittest.TestCase):
             in coverage of latitude as defined by the resulting Earth-centric half-angle subtended by twice the roll angle (the same latitude throughout the massion). 
 
         """ 
-        # setup spacecraft with some parameters setup randomly     
+        # setup spacecraft with some parameters setup randomly (seeded generator so that the inputs are reproducible)
+        rng = random.Random(2)
         duration=0.1
-        sma = RE+random.uniform(350,850)
+        sma = RE+rng.uniform(350,850)
         alt = sma - RE
         orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2018, "month":5, "day":26, "hour":12, "minute":0, "second":0}, # JD: 2458265.00000
                       "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": sma, 
-                            "ecc": 0, "inc": 0, "raan": random.uniform(0,360), 
-                            "aop": random.uniform(0,360), "ta": random.uniform(0,360)}
+                            "ecc": 0, "inc": 0, "raan": rng.uniform(0,360), 
+                            "aop": rng.uniform(0,360), "ta": rng.uniform(0,360)}
                      }
 
         # 1st pointing-opt has random yaw, second and third pointing options have random rolls
-        yaw_po1 = random.uniform(0,360)
-        roll_po2 = random.uniform(0,30)
-        roll_po3 = random.uniform(0,-30)
+        yaw_po1 = rng.uniform(0,360)
+        roll_po2 = rng.uniform(0,30)
+        roll_po3 = rng.uniform(0,-30)
         instrument_dict = {"orientation": {"referenceFrame": "SC_BODY_FIXED", "convention": "REF_FRAME_ALIGNED"}, 
                                            "mode":[{"@id":111, "fieldOfViewGeometry": {"shape": "CIRCULAR", "diameter": 10}}], 
                                            "pointingOption":[{"referenceFrame": "NADIR_POINTING", "convention": "XYZ", "xRotation":0, "yRotation":0, "zRotation":yaw_po1},
@@ -244,22 +240,22 @@ class TestPointingOptionsCoverage(unittest.TestCase):
                         "duration": duration, "@id":None}))
 
         # perform checks on the output access data
-        access_data_df = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data
-        # iterate over each pointing-option
-        access_data_grp = access_data_df.groupby('pnt-opt index') # group according to ground-point indices
+        access_data_df = pd.read_csv(out_file_access, skiprows = [0,1,2,3], usecols=['pnt-opt index', 'lat [deg]'], 
+                                     dtype={'pnt-opt index': np.int64, 'lat [deg]': np.float64}) # 5th row header, 6th row onwards contains the data
+        pnt_opt_idx = access_data_df['pnt-opt index'].to_numpy()
+        access_lat = access_data_df['lat [deg]'].to_numpy()
+        # all the three pointing-options shall be present in the output
+        self.assertTrue(np.array_equal(np.unique(pnt_opt_idx), [0, 1, 2]))
         
         # pointing option with random yaw yaw_po1
-        group0 = access_data_grp.get_group(0)
-        group0_truth = np.zeros((len(group0),1))
-        self.assertTrue(np.allclose(group0['lat [deg]'].to_numpy(), group0_truth))
-        # pointing option with random roll roll_po2
-        group1 = access_data_grp.get_group(1)
-        group1_truth = np.zeros((len(group1),))  + round(0.5*GeoUtilityFunctions.get_eca(2*roll_po2, alt),2)        
-        self.assertTrue(np.allclose(group1['lat [deg]'].to_numpy(), group1_truth))
+        group0_lat = access_lat[pnt_opt_idx == 0]
+        self.assertTrue(np.allclose(group0_lat, 0))
+        # pointing option with random roll roll_po2 (the access file lists lat to 2 decimal places)
+        group1_lat = access_lat[pnt_opt_idx == 1]
+        self.assertTrue(np.allclose(group1_lat, 0.5*GeoUtilityFunctions.get_eca(2*roll_po2, alt), atol=1e-2))
         # pointing option with random roll roll_po3
-        group2 = access_data_grp.get_group(2) 
-        group2_truth = np.zeros((len(group2),)) + round(0.5*GeoUtilityFunctions.get_eca(2*roll_po3, alt), 2)
-        self.assertTrue(np.allclose(group2['lat [deg]'].to_numpy(), group2_truth))
+        group2_lat = access_lat[pnt_opt_idx == 2]
+        self.assertTrue(np.allclose(group2_lat, 0.5*GeoUtilityFunctions.get_eca(2*roll_po3, alt), atol=1e-2))
 
      
 
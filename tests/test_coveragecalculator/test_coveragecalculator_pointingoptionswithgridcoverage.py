@@ -11,7 +11,7 @@ TODO: tests to check behavior with multiple sensors, modes
 """
 
 import json
-import os, shutil
+import os
 import sys
 import unittest
 import numpy as np
@@ -31,6 +31,7 @@ from instrupy import Instrument
 
 sys.path.append('../')
 from util.spacecrafts import spc1_json, spc2_json, spc3_json, spc4_json, spc5_json
+from util.helpers import make_out_dir, propagate
 
 RE = 6378.137 # radius of Earth in kilometers
     
@@ -38,17 +39,16 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Create new working directory to store output of all the class functions. 
+        # Create new (unique) working directory to store output of all the class functions.
         cls.dir_path = os.path.dirname(os.path.realpath(__file__))
-        cls.out_dir = os.path.join(cls.dir_path, 'temp')
-        if os.path.exists(cls.out_dir):
-            shutil.rmtree(cls.out_dir)
-        os.makedirs(cls.out_dir)
+        cls.out_dir = make_out_dir(cls, prefix='pntoptgridcov_')
 
         # make propagator
         factory = PropagatorFactory()
         cls.step_size = 1
         cls.j2_prop = factory.get_propagator({"@type": 'J2 ANALYTICAL PROPAGATOR', "stepSize": cls.step_size})
+        # cache of the propagated state files, keyed by the orbit-state and duration (see util.helpers.propagate)
+        cls._prop_cache = {}
 
     def test_from_dict(self):
         o = PointingOptionsWithGridCoverage.from_dict({ "grid":{"@type": "autogrid", "@id": 1, "latUpper":25, "latLower":-25, "lonUpper":180, "lonLower":-180, "gridRes": 2},
@@ -87,9 +87,8 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
 
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # generate grid object
         grid = Grid.from_autogrid_dict({"@type": "autogrid", "@id": 1, "latUpper":90, "latLower":-90, "lonUpper":180, "lonLower":-180, "gridRes": 1})
         # set output file path
@@ -110,43 +109,37 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
                         "duration": duration, "@id":None}))
 
         # check the outputs
-        cov_calc_type = pd.read_csv(out_file_access, nrows=1, header=None).astype(str) # 1st row contains the coverage calculation type
-        cov_calc_type = str(cov_calc_type[0][0])
+        with open(out_file_access) as f:
+            cov_calc_type = f.readline().strip() # 1st row contains the coverage calculation type
+            epoch_JDUT1 = float(f.readline().split()[3]) # 2nd row contains the epoch
+            _step_size = float(f.readline().split()[4]) # 3rd row contains the stepsize
+            _duration = float(f.readline().split()[4]) # 4th row contains the mission duration
+            column_headers = f.readline().strip().split(',') # 5th row contains the columns headers
+            access_data = pd.read_csv(f, header=None, names=column_headers) # 6th row onwards contains the data
         self.assertEqual(cov_calc_type, 'POINTING OPTIONS WITH GRID COVERAGE')
-
-        epoch_JDUT1 = pd.read_csv(out_file_access, skiprows = [0], nrows=1, header=None).astype(str) # 2nd row contains the epoch
-        epoch_JDUT1 = float(epoch_JDUT1[0][0].split()[3])
         self.assertEqual(epoch_JDUT1, 2458265.0)
-
-        _step_size = pd.read_csv(out_file_access, skiprows = [0,1], nrows=1, header=None).astype(str) # 3rd row contains the stepsize
-        _step_size = float(_step_size[0][0].split()[4])
         self.assertAlmostEqual(_step_size, self.step_size)
-
-        _duration = pd.read_csv(out_file_access, skiprows = [0,1,2], nrows=1, header=None).astype(str) # 4th row contains the mission duration
-        _duration = float(_duration[0][0].split()[4])
         self.assertAlmostEqual(_duration, duration)
-
-        column_headers = pd.read_csv(out_file_access, skiprows = [0,1,2,3], nrows=1, header=None).astype(str) # 5th row contains the columns headers
-        self.assertEqual(column_headers.iloc[0][0],"time index")
-        self.assertEqual(column_headers.iloc[0][1],"pnt-opt index")
-        self.assertEqual(column_headers.iloc[0][2],"GP index")
-        self.assertEqual(column_headers.iloc[0][3],"lat [deg]")
-        self.assertEqual(column_headers.iloc[0][4],"lon [deg]")
+        self.assertEqual(column_headers[0],"time index")
+        self.assertEqual(column_headers[1],"pnt-opt index")
+        self.assertEqual(column_headers[2],"GP index")
+        self.assertEqual(column_headers[3],"lat [deg]")
+        self.assertEqual(column_headers[4],"lon [deg]")
 
         # check that the grid indices are interpreted correctly
-        access_data = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data        
         if not access_data.empty:
-            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].tolist())
-            self.assertTrue(lat==access_data['lat [deg]'].tolist())
-            self.assertTrue(lon==access_data['lon [deg]'].tolist())
+            (lat, lon) = grid.get_lat_lon_from_index(access_data['GP index'].to_numpy())
+            self.assertTrue(np.array_equal(lat, access_data['lat [deg]'].to_numpy()))
+            self.assertTrue(np.array_equal(lon, access_data['lon [deg]'].to_numpy()))
         else:
             warnings.warn('No data was generated in test_execute_0(.). Run the test again.')
     
     def test_execute_1(self):
         """ Test the result of PointingOptionsWithGridCoverage with separate runs of GridCoverage.
         """
-        
-        duration=random.random()
+        # short fixed duration (same as in test_execute_3(.), so that the propagated states are shared). The comparison with the GridCoverage
+        # runs holds for any duration.
+        duration = 0.0025
         orbit_dict = {"date":{"dateType":"GREGORIAN_UTC", "year":2021, "month":8, "day":30, "hour":16, "minute":0, "second":0}, # JD: 2459457.1666666665
                       "state":{"stateType": "KEPLERIAN_EARTH_CENTERED_INERTIAL", "sma": RE+750, 
                             "ecc": 0, "inc": 60, "raan": 240, 
@@ -173,9 +166,8 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
                            ]
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
         # set output file path
         out_file_access = self.out_dir+'/test_cov_access1.csv'
         # run the coverage calculator, bs1 instrument
@@ -194,9 +186,12 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
                         "duration": duration, "@id":None}))
 
         access_data1 = pd.read_csv(out_file_access, skiprows = [0,1,2,3]) # 5th row header, 6th row onwards contains the data 
-        access_data1_grp = access_data1.groupby('pnt-opt index') # group according to ground-point indices
-        group0 = access_data1_grp.get_group(0)
-        group1 = access_data1_grp.get_group(1)
+        # row positions of each pointing-option
+        access_data1_idx = access_data1.groupby('pnt-opt index', sort=False).indices
+        group0 = access_data1_idx[0]
+        group1 = access_data1_idx[1]
+        time_index1 = access_data1['time index'].to_numpy()
+        gp_index1 = access_data1['GP index'].to_numpy()
         
         # simulation-2 with GridCoverage
         # set output file path
@@ -215,11 +210,11 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
 
         # compare results
         # group0 == access_data2, group1 == access_data3
-        self.assertTrue(np.allclose(group0['time index'].to_numpy(), access_data2['time index'].to_numpy()))
-        self.assertTrue(np.allclose(group0['GP index'].to_numpy(), access_data2['GP index'].to_numpy()))
+        self.assertTrue(np.array_equal(time_index1[group0], access_data2['time index'].to_numpy()))
+        self.assertTrue(np.array_equal(gp_index1[group0], access_data2['GP index'].to_numpy()))
 
-        self.assertTrue(np.allclose(group1['time index'].to_numpy(), access_data3['time index'].to_numpy()))
-        self.assertTrue(np.allclose(group1['GP index'].to_numpy(), access_data3['GP index'].to_numpy()))
+        self.assertTrue(np.array_equal(time_index1[group1], access_data3['time index'].to_numpy()))
+        self.assertTrue(np.array_equal(gp_index1[group1], access_data3['GP index'].to_numpy()))
     
 
     def test_execute_3(self):
@@ -253,9 +248,8 @@ class TestPointingOptionsWithGridCoverage(unittest.TestCase):
                            ]
         sat = Spacecraft.from_dict({"orbitState":orbit_dict, "instrument":instrument_dict, "spacecraftBus":spacecraftBus_dict})
 
-        state_cart_file = self.out_dir+'/test_cov_cart_states.csv'
         # execute propagator
-        self.j2_prop.execute(spacecraft=sat, start_date=None, out_file_cart=state_cart_file, duration=duration)
+        state_cart_file = propagate(self.j2_prop, self.out_dir, self._prop_cache, sat, duration)
 
         out_file_access = self.out_dir+'/test_cov_access1.csv'
         # run the coverage calculator, bs1 instrument
@@ -168,6 +168,15 @@ class TestGrid(unittest.TestCase):
                                                              [cdata.longitude[0], cdata.longitude[1], cdata.longitude[2]]))
         self.assertEqual(o.get_lat_lon_from_index([10,1,5]), ([cdata.latitude[10], cdata.latitude[1], cdata.latitude[5]], 
                                                              [cdata.longitude[10], cdata.longitude[1], cdata.longitude[5]]))
+        # numpy array of input indices
+        (lat, lon) = o.get_lat_lon_from_index(np.array([10,1,5]))
+        self.assertIsInstance(lat, np.ndarray)
+        self.assertIsInstance(lon, np.ndarray)
+        self.assertEqual(list(lat), [cdata.latitude[10], cdata.latitude[1], cdata.latitude[5]])
+        self.assertEqual(list(lon), [cdata.longitude[10], cdata.longitude[1], cdata.longitude[5]])
+        (lat, lon) = o.get_lat_lon_from_index(np.array([100]))
+        self.assertEqual(list(lat), [cdata.latitude[100]])
+        self.assertEqual(list(lon), [cdata.longitude[100]])
 
     def test_get_lat_lon(self): #TODO
         pass
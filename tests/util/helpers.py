@@ -0,0 +1,58 @@
+"""Helper functions shared by the test modules."""
+import json
+import os
+import shutil
+import tempfile
+
+# The working directories are made on the RAM-backed /dev/shm filesystem when available, since the tests repeatedly write and
+# read back the state and access files.
+_WORK_DIR_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+def make_out_dir(test_cls, prefix):
+    """ Create a new (unique) working directory to store the output of all the functions of a test class. The directory is
+        registered for removal as a class cleanup, so that it is removed even if the rest of the class setup fails.
+
+    :param test_cls: Test class (to be called from its ``setUpClass``).
+    :paramtype test_cls: :class:`unittest.TestCase`
+
+    :param prefix: Prefix of the directory name.
+    :paramtype prefix: str
+
+    :return: Path to the working directory.
+    :rtype: str
+
+    """
+    out_dir = tempfile.mkdtemp(prefix=prefix, dir=_WORK_DIR_ROOT)
+    test_cls.addClassCleanup(shutil.rmtree, out_dir, ignore_errors=True)
+    return out_dir
+
+def propagate(propagator, out_dir, cache, sat, duration):
+    """ Propagate the orbit of the input spacecraft and return the path to the resulting cartesian state file. 
+        Propagation does not depend on the sensor, hence the state file is reused (via the input cache) across tests having the same 
+        orbit-state and duration.
+
+    :param propagator: Propagator to be used.
+    :paramtype propagator: :class:`orbitpy.propagator.J2AnalyticalPropagator`
+
+    :param out_dir: Directory in which the state files are written.
+    :paramtype out_dir: str
+
+    :param cache: Cache of the propagated state file paths, keyed by the orbit-state and duration. Updated in place.
+    :paramtype cache: dict
+
+    :param sat: Spacecraft whose orbit is to be propagated.
+    :paramtype sat: :class:`orbitpy.util.Spacecraft`
+
+    :param duration: Propagation duration in days.
+    :paramtype duration: float
+
+    :return: Path to the cartesian state file.
+    :rtype: str
+
+    """
+    key = (json.dumps(sat.orbitState.to_dict(), sort_keys=True), duration)
+    if key not in cache:
+        state_cart_file = os.path.join(out_dir, 'test_cov_cart_states{}.csv'.format(len(cache)))
+        propagator.execute(spacecraft=sat, out_file_cart=state_cart_file, duration=duration)
+        cache[key] = state_cart_file
+    return cache[key]